@@ -3,6 +3,13 @@ const nextConfig = {
   // Use separate directories for dev (turbopack) vs production build
   distDir: process.env.NODE_ENV === 'production' ? '.next' : '.next-dev',
 
+  // Gzip analysis/review payloads (scorecards, wikis, profiles run to tens of
+  // kilobytes) when self-hosting with `next start`. Next.js skips compression
+  // for text/event-stream, so tRPC SSE subscriptions still flush incrementally.
+  // Behind a proxy that compresses, disable this and let the proxy do it once
+  // (see docs/LOCAL_DEVELOPMENT.md, "Self-Hosted Production Serving").
+  compress: true,
+
   images: {
     remotePatterns: [
       {
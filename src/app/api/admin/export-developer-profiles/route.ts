@@ -60,55 +60,76 @@ export async function GET(request: NextRequest) {
 
     // Convert to CSV
     const csvHeader = 'Name,Email,Rank,Tier,ELO Rating,Profile Score,Skills,Professional Summary,Rooms for Improvement,Top Repos\n';
-    const csvRows = (results as any[])
-      .map((row) => {
-        const name = escapeCSV(row.name);
-        const email = escapeCSV(row.email ?? '');
-        const rank = row.rank ?? '';
-        const tier = escapeCSV(row.tier ?? '');
-        const eloRating = row.elo_rating ?? '';
+    const formatCsvRow = (row: any): string => {
+      const name = escapeCSV(row.name);
+      const email = escapeCSV(row.email ?? '');
+      const rank = row.rank ?? '';
+      const tier = escapeCSV(row.tier ?? '');
+      const eloRating = row.elo_rating ?? '';
+      
+      // Calculate profile score from skill assessment
+      let profileScore = '';
+      let skillsText = '';
+      const skillAssessment = row.skill_assessment;
+      if (skillAssessment && Array.isArray(skillAssessment)) {
+        const avg = skillAssessment.reduce((sum: number, skill: any) => sum + skill.score, 0) / skillAssessment.length;
+        profileScore = avg.toFixed(1);
         
-        // Calculate profile score from skill assessment
-        let profileScore = '';
-        let skillsText = '';
-        const skillAssessment = row.skill_assessment;
-        if (skillAssessment && Array.isArray(skillAssessment)) {
-          const avg = skillAssessment.reduce((sum: number, skill: any) => sum + skill.score, 0) / skillAssessment.length;
-          profileScore = avg.toFixed(1);
-          
-          // Format skills as: Skill (score), Skill (score), etc.
-          skillsText = skillAssessment
-            .map((skill: any) => `${skill.metric} (${skill.score})`)
-            .join('; ');
-        }
-        
-        const summary = escapeCSV(row.professional_summary ?? '');
-        
-        // Extract suggestions (rooms for improvement)
-        const suggestions = row.suggestions || [];
-        const suggestionsText = suggestions
-          .map((s: any) => (typeof s === 'string' ? s : '').replace(/^(-\s*|\d+\.\s*)/, '').trim())
-          .filter((s: string) => s.length > 0)
+        // Format skills as: Skill (score), Skill (score), etc.
+        skillsText = skillAssessment
+          .map((skill: any) => `${skill.metric} (${skill.score})`)
           .join('; ');
-        const improvementText = escapeCSV(suggestionsText);
-        
-        // Extract top repos
-        const topRepos = row.top_repos || [];
-        const reposText = topRepos
-          .map((repo: any) => `${repo.name} (${repo.description})`)
-          .join('; ');
-        const reposEscaped = escapeCSV(reposText);
-        
-        const skillsEscaped = escapeCSV(skillsText);
-        
-        return `${name},${email},${rank},${tier},${eloRating},${profileScore},${skillsEscaped},${summary},${improvementText},${reposEscaped}`;
-      })
-      .join('\n');
+      }
+      
+      const summary = escapeCSV(row.professional_summary ?? '');
+      
+      // Extract suggestions (rooms for improvement)
+      const suggestions = row.suggestions || [];
+      const suggestionsText = suggestions
+        .map((s: any) => (typeof s === 'string' ? s : '').replace(/^(-\s*|\d+\.\s*)/, '').trim())
+        .filter((s: string) => s.length > 0)
+        .join('; ');
+      const improvementText = escapeCSV(suggestionsText);
+      
+      // Extract top repos
+      const topRepos = row.top_repos || [];
+      const reposText = topRepos
+        .map((repo: any) => `${repo.name} (${repo.description})`)
+        .join('; ');
+      const reposEscaped = escapeCSV(reposText);
+      
+      const skillsEscaped = escapeCSV(skillsText);
+      
+      return `${name},${email},${rank},${tier},${eloRating},${profileScore},${skillsEscaped},${summary},${improvementText},${reposEscaped}\n`;
+    };
 
-    const csvContent = csvHeader + csvRows;
+    // Stream the CSV instead of concatenating one giant string. Rows are
+    // formatted in pull(), one per read, so production is demand-driven:
+    // the download starts with the header immediately, formatting tracks
+    // the consumer (backpressure), and no second full-size copy of the
+    // export is ever queued up. The query result itself is still held in
+    // memory; only the formatted CSV avoids it.
+    const encoder = new TextEncoder();
+    const rows = results as any[];
+    let nextRow = 0;
+    let headerSent = false;
+    const stream = new ReadableStream<Uint8Array>({
+      pull(controller) {
+        if (!headerSent) {
+          headerSent = true;
+          controller.enqueue(encoder.encode(csvHeader));
+          return;
+        }
+        if (nextRow >= rows.length) {
+          controller.close();
+          return;
+        }
+        controller.enqueue(encoder.encode(formatCsvRow(rows[nextRow++])));
+      },
+    });
 
     // Return CSV file
-    return new NextResponse(csvContent, {
+    return new NextResponse(stream, {
       headers: {
         'Content-Type': 'text/csv; charset=utf-8',
         'Content-Disposition': `attachment; filename="developer-profiles-${new Date().toISOString().split('T')[0]}.csv"`,
@@ -23,11 +23,27 @@ const handler = (req: Request) => {
     }
   }
 
+  // Subscription requests negotiate SSE via the Accept header. Mark those
+  // responses as non-bufferable so reverse proxies (nginx buffers by default)
+  // and intermediaries don't hold frames until the stream ends — buffered SSE
+  // means the client sees nothing until the whole analysis finishes, then
+  // reconnects in a loop.
+  const isEventStream = req.headers.get('accept')?.includes('text/event-stream') ?? false;
+
   return fetchRequestHandler({
     endpoint: '/api/trpc',
     req,
     router: appRouter,
     createContext: () => createContext(req),
+    responseMeta: () =>
+      isEventStream
+        ? {
+            headers: {
+              'Cache-Control': 'no-cache, no-transform',
+              'X-Accel-Buffering': 'no',
+            },
+          }
+        : {},
   });
 };
 
@@ -1,6 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getProfileData } from '@/lib/profile/service';
 import { requireApiKey, isErrorResponse } from '@/lib/api/auth';
+import { CORS_HEADERS, handlePreflight, withCors } from '@/lib/api/cors';
+
+export { handlePreflight as OPTIONS };
 
 type RouteContext = {
   params: Promise<{ username: string }>;
@@ -28,7 +31,7 @@ export async function GET(
   // Require API key with 'read' scope
   const authResult = await requireApiKey(request, 'read');
   if (isErrorResponse(authResult)) {
-    return authResult;
+    return withCors(authResult);
   }
 
   try {
@@ -37,7 +40,7 @@ export async function GET(
     if (!username || username.length < 1) {
       return NextResponse.json(
         { error: 'Username is required' },
-        { status: 400 }
+        { status: 400, headers: CORS_HEADERS }
       );
     }
 
@@ -51,6 +54,7 @@ export async function GET(
       lastUpdated: data.lastUpdated?.toISOString() || null,
     }, {
       headers: {
+        ...CORS_HEADERS,
         'Cache-Control': 'public, s-maxage=300, stale-while-revalidate=600',
       }
     });
@@ -58,7 +62,7 @@ export async function GET(
     console.error('Error fetching profile:', error);
     return NextResponse.json(
       { error: 'Failed to fetch profile' },
-      { status: 500 }
+      { status: 500, headers: CORS_HEADERS }
     );
   }
 }
@@ -4,6 +4,9 @@ import { developerProfileCache } from '@/db/schema';
 import { desc, sql, and } from 'drizzle-orm';
 import type { DeveloperProfile } from '@/lib/types/profile';
 import { requireApiKey, isErrorResponse } from '@/lib/api/auth';
+import { CORS_HEADERS, handlePreflight, withCors } from '@/lib/api/cors';
+
+export { handlePreflight as OPTIONS };
 
 /**
  * GET /api/v1/profiles/search
@@ -31,7 +34,7 @@ export async function GET(request: NextRequest) {
   // Require API key with 'read' scope
   const authResult = await requireApiKey(request, 'read');
   if (isErrorResponse(authResult)) {
-    return authResult;
+    return withCors(authResult);
   }
 
   try {
@@ -159,6 +162,7 @@ export async function GET(request: NextRequest) {
       hasMore,
     }, {
       headers: {
+        ...CORS_HEADERS,
         'Cache-Control': 'public, s-maxage=60, stale-while-revalidate=300',
       }
     });
@@ -166,7 +170,7 @@ export async function GET(request: NextRequest) {
     console.error('Error searching profiles:', error);
     return NextResponse.json(
       { error: 'Failed to search profiles' },
-      { status: 500 }
+      { status: 500, headers: CORS_HEADERS }
     );
   }
 }
@@ -3,6 +3,9 @@ import { db } from '@/db';
 import { repositoryScorecards } from '@/db/schema';
 import { eq, and, desc } from 'drizzle-orm';
 import { requireApiKey, isErrorResponse } from '@/lib/api/auth';
+import { CORS_HEADERS, handlePreflight, withCors } from '@/lib/api/cors';
+
+export { handlePreflight as OPTIONS };
 
 type RouteContext = {
   params: Promise<{ owner: string; repo: string }>;
@@ -35,7 +38,7 @@ export async function GET(
   // Require API key with 'read' scope
   const authResult = await requireApiKey(request, 'read');
   if (isErrorResponse(authResult)) {
-    return authResult;
+    return withCors(authResult);
   }
 
   try {
@@ -46,7 +49,7 @@ export async function GET(
     if (!owner || !repo) {
       return NextResponse.json(
         { error: 'Owner and repo are required' },
-        { status: 400 }
+        { status: 400, headers: CORS_HEADERS }
       );
     }
 
@@ -81,11 +84,11 @@ export async function GET(
         cached: false,
         stale: false,
         lastUpdated: null,
-      }, { status: 200 });
+      }, { status: 200, headers: CORS_HEADERS });
     }
 
     const scorecard = scorecards[0];
-    const isStale = new Date().getTime() - scorecard.updatedAt.getTime() > 7 * 24 * 60 * 60 * 1000; // 7 days
+    const isStale = Date.now() - scorecard.updatedAt.getTime() > 7 * 24 * 60 * 60 * 1000; // 7 days
 
     return NextResponse.json({
       owner: normalizedOwner,
@@ -102,6 +105,7 @@ export async function GET(
       ref: scorecard.ref,
     }, {
       headers: {
+        ...CORS_HEADERS,
         'Cache-Control': 'public, s-maxage=300, stale-while-revalidate=600',
       }
     });
@@ -109,7 +113,7 @@ export async function GET(
     console.error('Error fetching scorecard:', error);
     return NextResponse.json(
       { error: 'Failed to fetch scorecard' },
-      { status: 500 }
+      { status: 500, headers: CORS_HEADERS }
     );
   }
 }
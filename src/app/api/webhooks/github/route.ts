@@ -462,19 +462,29 @@ export async function POST(request: Request) {
     return new Response('Signature verification failed', { status: 401 });
   }
 
-  // Rate limit by installation ID after signature is verified
+  // Parse once and reuse. Push payloads run to hundreds of KB; this body was
+  // previously JSON.parsed twice (rate limiting, then dispatch).
+  let parsedPayload: { installation?: { id?: number } };
   try {
-    const parsed = JSON.parse(payload);
-    const installationId = parsed?.installation?.id;
-    if (installationId) {
-      const { allowed } = checkGitHubWebhookRateLimit(installationId);
-      if (!allowed) {
-        logger.warn('Webhook rate limit exceeded', { event, delivery, installationId });
-        return new Response('Rate limit exceeded', { status: 429 });
-      }
+    parsedPayload = JSON.parse(payload);
+  } catch (error) {
+    logger.error('Invalid JSON payload', {
+      event,
+      delivery,
+      payloadLength: payload.length,
+      error: error instanceof Error ? error.message : String(error),
+    });
+    return new Response('Invalid JSON payload', { status: 400 });
+  }
+
+  // Rate limit by installation ID after signature is verified
+  const installationId = parsedPayload?.installation?.id;
+  if (installationId) {
+    const { allowed } = checkGitHubWebhookRateLimit(installationId);
+    if (!allowed) {
+      logger.warn('Webhook rate limit exceeded', { event, delivery, installationId });
+      return new Response('Rate limit exceeded', { status: 429 });
     }
-  } catch {
-    // If payload parsing fails here, webhooks.receive will handle it below
   }
 
   try {
@@ -483,7 +493,7 @@ export async function POST(request: Request) {
     await webhooks.receive({
       id: delivery,
       name: event as string,
-      payload: JSON.parse(payload),
+      payload: parsedPayload,
     } as Parameters<typeof webhooks.receive>[0]);
 
     logger.info('SUCCESS: Successfully processed webhook event', {
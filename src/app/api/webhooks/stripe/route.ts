@@ -26,6 +26,112 @@ function getSubscriptionPeriodEnd(subscription: Stripe.Subscription): Date {
   return new Date(periodEnd * 1000);
 }
 
+// Helper to extract the subscription id from an invoice event payload
+function getInvoiceSubscriptionId(invoice: Stripe.Invoice): string | undefined {
+  const subId = 'subscription' in invoice ? (invoice as { subscription?: string }).subscription : undefined;
+  return typeof subId === 'string' ? subId : undefined;
+}
+
+async function handleCheckoutCompleted(event: Stripe.Event): Promise<void> {
+  const session = event.data.object as Stripe.Checkout.Session;
+
+  if (session.mode !== 'subscription' || !session.subscription) {
+    return;
+  }
+
+  const subscription = await stripe!.subscriptions.retrieve(session.subscription as string) as Stripe.Subscription;
+  const plan = session.metadata?.plan as Plan;
+  const userId = session.metadata?.userId;
+
+  if (!userId || !plan) {
+    logger.error('Missing metadata in checkout session', undefined, { metadata: JSON.stringify(session.metadata) });
+    return;
+  }
+
+  // Log the subscription object for debugging
+  logger.debug('Stripe subscription object', { subscription });
+
+  // Create or update user subscription
+  const periodEnd = getSubscriptionPeriodEnd(subscription);
+  await db.insert(userSubscriptions).values({
+    userId,
+    stripeCustomerId: subscription.customer as string,
+    stripeSubscriptionId: subscription.id,
+    plan,
+    status: subscription.status,
+    currentPeriodEnd: periodEnd,
+  }).onConflictDoUpdate({
+    target: userSubscriptions.userId,
+    set: {
+      stripeCustomerId: subscription.customer as string,
+      stripeSubscriptionId: subscription.id,
+      plan,
+      status: subscription.status,
+      currentPeriodEnd: periodEnd,
+    }
+  });
+
+  logger.info('Successfully saved subscription to database', { userId, plan, subscriptionId: subscription.id });
+}
+
+async function handleSubscriptionUpdated(event: Stripe.Event): Promise<void> {
+  const subscription = event.data.object as Stripe.Subscription;
+
+  logger.info('Updating subscription', { subscriptionId: subscription.id, status: subscription.status });
+
+  await db.update(userSubscriptions)
+    .set({
+      status: subscription.status,
+      currentPeriodEnd: getSubscriptionPeriodEnd(subscription),
+    })
+    .where(eq(userSubscriptions.stripeSubscriptionId, subscription.id));
+}
+
+async function handleSubscriptionDeleted(event: Stripe.Event): Promise<void> {
+  const subscription = event.data.object as Stripe.Subscription;
+
+  logger.info('Canceling subscription', { subscriptionId: subscription.id });
+
+  // Mark subscription as canceled
+  await db.update(userSubscriptions)
+    .set({ status: 'canceled' })
+    .where(eq(userSubscriptions.stripeSubscriptionId, subscription.id));
+}
+
+async function handlePaymentFailed(event: Stripe.Event): Promise<void> {
+  const subId = getInvoiceSubscriptionId(event.data.object as Stripe.Invoice);
+  if (!subId) return;
+
+  logger.warn('Payment failed for subscription', { subscriptionId: subId });
+
+  // Mark subscription as past_due
+  await db.update(userSubscriptions)
+    .set({ status: 'past_due' })
+    .where(eq(userSubscriptions.stripeSubscriptionId, subId));
+}
+
+async function handlePaymentSucceeded(event: Stripe.Event): Promise<void> {
+  const subId = getInvoiceSubscriptionId(event.data.object as Stripe.Invoice);
+  if (!subId) return;
+
+  logger.info('Payment succeeded for subscription', { subscriptionId: subId });
+
+  // Mark subscription as active
+  await db.update(userSubscriptions)
+    .set({ status: 'active' })
+    .where(eq(userSubscriptions.stripeSubscriptionId, subId));
+}
+
+// Dispatch table built once at module load — adding an event type is one entry
+// here plus its handler, and unhandled types fall through to a debug log.
+const eventHandlers: Record<string, (event: Stripe.Event) => Promise<void>> = {
+  'checkout.session.completed': handleCheckoutCompleted,
+  'customer.subscription.updated': handleSubscriptionUpdated,
+  'customer.subscription.deleted': handleSubscriptionDeleted,
+  'invoice.payment_failed': handlePaymentFailed,
+  'invoice.payment_succeeded': handlePaymentSucceeded,
+};
+
 export async function POST(req: NextRequest) {
   if (!stripe || !webhookSecret) {
     logger.debug('Stripe not configured - ignoring webhook');
@@ -45,112 +151,19 @@ export async function POST(req: NextRequest) {
   }
 
   try {
-    switch (event.type) {
-      case 'checkout.session.completed': {
-        const session = event.data.object as Stripe.Checkout.Session;
-        
-        if (session.mode === 'subscription' && session.subscription) {
-          const subscription = await stripe!.subscriptions.retrieve(session.subscription as string) as Stripe.Subscription;
-          const plan = session.metadata?.plan as Plan;
-          const userId = session.metadata?.userId;
-          
-          if (!userId || !plan) {
-            logger.error('Missing metadata in checkout session', undefined, { metadata: JSON.stringify(session.metadata) });
-            break;
-          }
-
-           // Log the subscription object for debugging
-           logger.debug('Stripe subscription object', { subscription });
-
-          // Create or update user subscription
-          const periodEnd = getSubscriptionPeriodEnd(subscription);
-          await db.insert(userSubscriptions).values({
-            userId,
-            stripeCustomerId: subscription.customer as string,
-            stripeSubscriptionId: subscription.id,
-            plan,
-            status: subscription.status,
-            currentPeriodEnd: periodEnd,
-          }).onConflictDoUpdate({
-            target: userSubscriptions.userId,
-            set: {
-              stripeCustomerId: subscription.customer as string,
-              stripeSubscriptionId: subscription.id,
-              plan,
-              status: subscription.status,
-              currentPeriodEnd: periodEnd,
-            }
-          });
-
-           logger.info('Successfully saved subscription to database', { userId, plan, subscriptionId: subscription.id });
-          }
-          break;
-          }
-
-          case 'customer.subscription.updated': {
-          const subscription = event.data.object as Stripe.Subscription;
-
-          logger.info('Updating subscription', { subscriptionId: subscription.id, status: subscription.status });
-
-        await db.update(userSubscriptions)
-          .set({
-            status: subscription.status,
-            currentPeriodEnd: getSubscriptionPeriodEnd(subscription),
-          })
-          .where(eq(userSubscriptions.stripeSubscriptionId, subscription.id));
-        break;
-      }
-
-      case 'customer.subscription.deleted': {
-        const subscription = event.data.object as Stripe.Subscription;
-        
-        logger.info('Canceling subscription', { subscriptionId: subscription.id });
-        
-        // Mark subscription as canceled
-        await db.update(userSubscriptions)
-          .set({ status: 'canceled' })
-          .where(eq(userSubscriptions.stripeSubscriptionId, subscription.id));
-        break;
-      }
-
-      case 'invoice.payment_failed': {
-        const invoice = event.data.object as Stripe.Invoice;
-        const subId = typeof invoice === 'object' && 'subscription' in invoice ? (invoice as { subscription?: string }).subscription : undefined;
-        if (subId && typeof subId === 'string') {
-          logger.warn('Payment failed for subscription', { subscriptionId: subId });
-          
-          // Mark subscription as past_due
-          await db.update(userSubscriptions)
-            .set({ status: 'past_due' })
-            .where(eq(userSubscriptions.stripeSubscriptionId, subId));
-        }
-        break;
-      }
-
-      case 'invoice.payment_succeeded': {
-        const invoice = event.data.object as Stripe.Invoice;
-        const subId = typeof invoice === 'object' && 'subscription' in invoice ? (invoice as { subscription?: string }).subscription : undefined;
-        if (subId && typeof subId === 'string') {
-          logger.info('Payment succeeded for subscription', { subscriptionId: subId });
-          
-          // Mark subscription as active
-          await db.update(userSubscriptions)
-            .set({ status: 'active' })
-            .where(eq(userSubscriptions.stripeSubscriptionId, subId));
-        }
-        break;
-      }
-
-      default:
-        logger.debug(`Unhandled event type: ${event.type}`, { eventType: event.type });
-      }
-
-      return NextResponse.json({ received: true });
-      } catch (error) {
-      logger.error('Webhook processing error', error);
-      return NextResponse.json(
+    const handler = eventHandlers[event.type];
+    if (handler) {
+      await handler(event);
+    } else {
+      logger.debug(`Unhandled event type: ${event.type}`, { eventType: event.type });
+    }
+
+    return NextResponse.json({ received: true });
+  } catch (error) {
+    logger.error('Webhook processing error', error);
+    return NextResponse.json(
       { error: 'Webhook processing failed' },
       { status: 500 }
-      );
-      }
-      }
\ No newline at end of file
+    );
+  }
+}
@@ -0,0 +1,37 @@
+/**
+ * Next.js instrumentation hook — runs once per server process at startup.
+ *
+ * Warms the Postgres pool and the Upstash Redis client so the first real
+ * request after a boot or serverless cold start doesn't pay connection
+ * establishment on top of its own work. Both warmups are fire-and-forget:
+ * a dev box without DATABASE_URL or Redis configured must still boot.
+ */
+export async function register() {
+  if (process.env.NEXT_RUNTIME !== 'nodejs') return;
+
+  const { createLogger } = await import('@/lib/logging');
+  const logger = createLogger('Instrumentation');
+
+  if (process.env.DATABASE_URL) {
+    import('@/db')
+      .then(async ({ db }) => {
+        const { sql } = await import('drizzle-orm');
+        await db.execute(sql`SELECT 1`);
+        logger.info('Database connection warmed');
+      })
+      .catch((e) => logger.warn('Database warmup failed', { error: String(e) }));
+  }
+
+  const isRedisConfigured = !!(
+    (process.env.UPSTASH_REDIS_REST_URL && process.env.UPSTASH_REDIS_REST_TOKEN) ||
+    (process.env.KV_REST_API_URL && process.env.KV_REST_API_TOKEN)
+  );
+  if (isRedisConfigured) {
+    import('@upstash/redis')
+      .then(async ({ Redis }) => {
+        await Redis.fromEnv().ping();
+        logger.info('Redis connection warmed');
+      })
+      .catch((e) => logger.warn('Redis warmup failed', { error: String(e) }));
+  }
+}
@@ -465,7 +465,7 @@ export async function* generateDeveloperProfileStreaming({
     Your entire output must be a single, valid JSON object that strictly adheres to the provided Zod schema.
 
     Repository Metadata (${nonForkedRepos.length} original repositories, ${totalStars.toLocaleString()} total stars):
-    ${JSON.stringify(repoDataForPrompt, null, 2)}
+    ${JSON.stringify(repoDataForPrompt)}
     ${scorecardInsights ? `\nDetailed Code Analysis from Scorecards:\n${scorecardInsights}` : ''}
   `;
 
@@ -209,13 +209,13 @@ ${readme ? `EXISTING README:
 ${readme.slice(0, 2000)}
 
 ` : ''}${packageJson ? `PACKAGE.JSON:
-${JSON.stringify(packageJson, null, 2).slice(0, 1000)}
+${JSON.stringify(packageJson).slice(0, 1000)}
 
 ` : ''}ANALYZED COMPONENTS (${allComponents.length} total):
-${JSON.stringify(allComponents.slice(0, 50), null, 2)}
+${JSON.stringify(allComponents.slice(0, 50))}
 
 API ENDPOINTS (${allApiEndpoints.length} total):
-${JSON.stringify(allApiEndpoints, null, 2)}
+${JSON.stringify(allApiEndpoints)}
 
 OBSERVATIONS FROM ALL CHUNKS:
 ${allObservations}
@@ -364,7 +364,7 @@ ${readme ? `EXISTING README:
 ${readme.slice(0, 2000)}
 
 ` : ''}${packageJson ? `PACKAGE.JSON:
-${JSON.stringify(packageJson, null, 2).slice(0, 1000)}
+${JSON.stringify(packageJson).slice(0, 1000)}
 
 ` : ''}CODEBASE FILES:
 ${fileContents}
@@ -105,7 +105,7 @@ ${primaryLanguage ? `Primary Language: ${primaryLanguage}` : ''}
 ${readme || 'No README available'}
 
 ## Package.json
-${packageJson ? JSON.stringify(packageJson, null, 2) : 'No package.json'}
+${packageJson ? JSON.stringify(packageJson) : 'No package.json'}
 
 ## File Tree
 ${files.map(f => f.path).join('\n')}
@@ -303,6 +303,33 @@ function groupPagesByLevel(pages: WikiPage[]): WikiPage[][] {
   return levels;
 }
 
+// Generate one dependency level's pages with bounded concurrency. Levels on
+// large repos can hold a dozen-plus pages; an unbounded Promise.all fires one
+// Gemini call per page at once and trips provider rate limits.
+const MAX_PAGE_CONCURRENCY = 3;
+
+async function generateLevelPages(
+  cacheId: string,
+  level: WikiPage[],
+  generatedPages: Map<string, GeneratedPage>
+): Promise<GeneratedPage[]> {
+  const results: GeneratedPage[] = new Array(level.length);
+  let currentIndex = 0;
+
+  async function worker(): Promise<void> {
+    while (true) {
+      const index = currentIndex++;
+      if (index >= level.length) return;
+      results[index] = await generateWikiPage(cacheId, level[index], generatedPages);
+    }
+  }
+
+  await Promise.all(
+    Array(Math.min(MAX_PAGE_CONCURRENCY, level.length)).fill(null).map(() => worker())
+  );
+  return results;
+}
+
 /**
  * Generate a single wiki page using cached context
  */
@@ -405,10 +432,8 @@ export async function generateWikiWithCache(
       console.log(`📝 Generating level ${levelIndex + 1}/${pageLevels.length} (${level.length} pages in parallel)...`);
       params.onProgress?.(`Generating level ${levelIndex + 1}/${pageLevels.length}`, processedPages, totalPages);
 
-      // Generate all pages in this level in parallel
-      const levelResults = await Promise.all(
-        level.map(page => generateWikiPage(cacheId, page, generatedPages))
-      );
+      // Generate this level's pages with bounded concurrency
+      const levelResults = await generateLevelPages(cacheId, level, generatedPages);
 
       // Store results
       levelResults.forEach((generated) => {
@@ -518,11 +543,9 @@ export async function* generateWikiWithCacheStreaming(
         message: `Generating content: ${level.length} page${level.length > 1 ? 's' : ''} in parallel (batch ${levelIndex + 1}/${pageLevels.length})...`
       };
 
-      // Generate all pages in this level in parallel
+      // Generate this level's pages with bounded concurrency
       // Use heartbeat for generation too
-      const generationPromise = Promise.all(
-        level.map(page => generateWikiPage(cacheId, page, generatedPages))
-      );
+      const generationPromise = generateLevelPages(cacheId, level, generatedPages);
       
       for await (const ping of awaitWithHeartbeat(generationPromise)) {
         if (ping.type === 'ping') {
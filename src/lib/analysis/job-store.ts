@@ -53,26 +53,27 @@ if (isRedisConfigured) {
 // In-memory fallback for local dev (not production-safe)
 const memoryFallback = new Map<string, string>();
 
-// Store an object. We always JSON.stringify going in. Upstash will store the
-// string as-is; on read it auto-deserializes JSON-looking strings, so the
-// reader gets back the parsed object. We normalize that in redisGetJson.
+// Store an object. The Upstash client serializes values itself, so hand it
+// the object directly — pre-stringifying here just made the value cross the
+// wire as a quoted string and forced the typeof juggling on read. The memory
+// fallback keeps its own stringified copy so reads never alias a stored
+// object that a caller later mutates (dequeue/updateQueueItem do).
 async function redisSetJson<T>(key: string, value: T, ttlSeconds: number): Promise<void> {
-  const str = JSON.stringify(value);
   if (redis) {
-    await redis.set(key, str, { ex: ttlSeconds });
+    await redis.set(key, value, { ex: ttlSeconds });
   } else {
-    memoryFallback.set(key, str);
+    memoryFallback.set(key, JSON.stringify(value));
     setTimeout(() => memoryFallback.delete(key), ttlSeconds * 1000);
   }
 }
 
-// Returns the stored object or null. Handles both Upstash auto-parsed
-// objects and the local memoryFallback (which stores raw strings).
+// Returns the stored object or null. Upstash auto-deserializes on read —
+// including legacy values written as pre-stringified JSON — so only the
+// memoryFallback path still parses by hand.
 async function redisGetJson<T>(key: string): Promise<T | null> {
   if (redis) {
-    const v = await redis.get<unknown>(key);
-    if (v === null || v === undefined) return null;
-    return (typeof v === 'string' ? JSON.parse(v) : v) as T;
+    const v = await redis.get<T>(key);
+    return v ?? null;
   }
   const raw = memoryFallback.get(key);
   return raw ? (JSON.parse(raw) as T) : null;
@@ -0,0 +1,61 @@
+/**
+ * Push-based progress queue for bridging callback-style onProgress producers
+ * into async-generator SSE subscriptions.
+ *
+ * Replaces the poll-every-500ms pattern: the consumer awaits a wake signal,
+ * so progress reaches the client the moment the producer reports it, and the
+ * generator sleeps the full heartbeat interval when nothing is happening
+ * instead of waking twice a second for the whole analysis.
+ */
+export class ProgressQueue<T> {
+  private items: T[] = [];
+  private closed = false;
+  private waiters: Array<() => void> = [];
+
+  /** Producer side: enqueue an item and wake any waiting consumer. */
+  push(item: T): void {
+    this.items.push(item);
+    this.wake();
+  }
+
+  /** Mark the stream finished and wake consumers. Idempotent. */
+  close(): void {
+    this.closed = true;
+    this.wake();
+  }
+
+  get isClosed(): boolean {
+    return this.closed;
+  }
+
+  /** Consumer side: remove and return everything currently queued. */
+  drain(): T[] {
+    if (this.items.length === 0) return [];
+    const drained = this.items;
+    this.items = [];
+    return drained;
+  }
+
+  /**
+   * Wait until something is pushed, the queue closes, or timeoutMs elapses —
+   * whichever comes first. Resolves immediately if items are already queued.
+   */
+  async wait(timeoutMs: number): Promise<void> {
+    if (this.items.length > 0 || this.closed || timeoutMs <= 0) return;
+    await new Promise<void>(resolve => {
+      const finish = () => {
+        clearTimeout(timer);
+        resolve();
+      };
+      const timer = setTimeout(finish, timeoutMs);
+      this.waiters.push(finish);
+    });
+  }
+
+  /** Wake all pending waiters without enqueueing (e.g. on client abort). */
+  wake(): void {
+    const waiters = this.waiters;
+    this.waiters = [];
+    for (const w of waiters) w();
+  }
+}
@@ -58,12 +58,29 @@ export function extractApiKey(request: NextRequest): string | null {
   return null;
 }
 
+// Short-lived cache of validated keys, keyed by key hash. Every v1 request
+// pays this lookup, and key records are effectively static between edits in
+// settings. The TTL bounds how long a revoked/expired key keeps working
+// (worst case 60s), which is acceptable for a read-scoped public API.
+const validatedKeyCache = new Map<string, { value: ValidatedApiKey; expiresAt: Date | null; timestamp: number }>();
+const VALIDATED_KEY_TTL_MS = 60 * 1000;
+
 /**
  * Validate an API key and return the key details
  */
 export async function validateApiKey(key: string): Promise<ValidatedApiKey | null> {
   const keyHash = hashApiKey(key);
 
+  const cached = validatedKeyCache.get(keyHash);
+  if (cached) {
+    const fresh = Date.now() - cached.timestamp < VALIDATED_KEY_TTL_MS;
+    const expired = cached.expiresAt !== null && cached.expiresAt < new Date();
+    if (fresh && !expired) {
+      return cached.value;
+    }
+    validatedKeyCache.delete(keyHash);
+  }
+
   const result = await db
     .select()
     .from(publicApiKeys)
@@ -86,20 +103,29 @@ export async function validateApiKey(key: string): Promise<ValidatedApiKey | nul
     return null;
   }
 
-  // Update last used timestamp (fire and forget)
+  // Update last used timestamp (fire and forget). Cache hits skip this, so
+  // lastUsedAt has cache-TTL granularity — fine for a "last seen" field.
   db.update(publicApiKeys)
     .set({ lastUsedAt: new Date() })
     .where(eq(publicApiKeys.id, apiKey.id))
     .execute()
     .catch(() => {}); // Ignore errors
 
-  return {
+  const validated: ValidatedApiKey = {
     id: apiKey.id,
     userId: apiKey.userId,
     name: apiKey.name,
     scopes: apiKey.scopes,
     rateLimit: apiKey.rateLimit,
   };
+
+  validatedKeyCache.set(keyHash, {
+    value: validated,
+    expiresAt: apiKey.expiresAt,
+    timestamp: Date.now(),
+  });
+
+  return validated;
 }
 
 /**
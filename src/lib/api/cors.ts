@@ -0,0 +1,33 @@
+import { NextResponse } from 'next/server';
+
+/**
+ * CORS support for the public /api/v1 endpoints.
+ *
+ * The header list is computed once at module load and lists the exact methods
+ * and request headers the API accepts instead of wildcards. Access-Control-Max-Age
+ * lets browsers cache the preflight for a day, so cross-origin SPA clients only
+ * pay the OPTIONS round-trip once per route.
+ */
+export const CORS_HEADERS = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Methods': 'GET, OPTIONS',
+  'Access-Control-Allow-Headers': 'authorization, x-api-key, content-type',
+  'Access-Control-Max-Age': '86400',
+} as const;
+
+/** Shared OPTIONS handler — re-export as `OPTIONS` from each /api/v1 route. */
+export function handlePreflight(): NextResponse {
+  return new NextResponse(null, { status: 204, headers: CORS_HEADERS });
+}
+
+/**
+ * Apply the CORS headers to an already-built response. Error responses need
+ * this as much as success ones — without Access-Control-Allow-Origin the
+ * browser reports an opaque network error instead of the 401/403/500 body.
+ */
+export function withCors(response: NextResponse): NextResponse {
+  for (const [key, value] of Object.entries(CORS_HEADERS)) {
+    response.headers.set(key, value);
+  }
+  return response;
+}
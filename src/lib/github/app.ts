@@ -7,6 +7,9 @@ import { auth } from '@/lib/auth';
 import { Octokit } from '@octokit/rest';
 import { createAppAuth } from '@octokit/auth-app';
 import { SessionData, parseError } from '@/lib/types/errors';
+import { createLogger } from '@/lib/logging';
+
+const logger = createLogger('GitHubApp');
 
 // Initialize the GitHub App (only if configured)
 export const githubApp = process.env.GITHUB_APP_ID && process.env.GITHUB_PRIVATE_KEY 
@@ -39,12 +42,23 @@ export function generateAppJWT(): string {
   });
 }
 
+// Installation tokens are valid for 1 hour. Cache them per installation and
+// refresh 5 minutes before expiry, so repeated repo lookups against the same
+// installation don't pay a JWT sign + GitHub token exchange each time.
+const installationTokenCache = new Map<number, { token: string; expiresAt: number }>();
+const TOKEN_EXPIRY_MARGIN_MS = 5 * 60 * 1000;
+
 // Get installation token for a specific installation
 export async function getInstallationToken(installationId: number): Promise<string> {
   if (!process.env.GITHUB_APP_ID || !process.env.GITHUB_PRIVATE_KEY) {
     throw new Error('GitHub App not configured');
   }
 
+  const cached = installationTokenCache.get(installationId);
+  if (cached && Date.now() < cached.expiresAt - TOKEN_EXPIRY_MARGIN_MS) {
+    return cached.token;
+  }
+
   try {
     const auth = createAppAuth({
       appId: process.env.GITHUB_APP_ID,
@@ -52,7 +66,11 @@ export async function getInstallationToken(installationId: number): Promise<stri
       installationId,
     });
 
-    const { token } = await auth({ type: 'installation' });
+    const { token, expiresAt } = await auth({ type: 'installation' });
+    installationTokenCache.set(installationId, {
+      token,
+      expiresAt: new Date(expiresAt).getTime(),
+    });
     return token;
   } catch (error: unknown) {
     const errorMessage = parseError(error);
@@ -71,7 +89,7 @@ export async function getInstallationOctokit(installationId: number) {
 // Get installation ID for a repository
 export async function getInstallationIdForRepo(owner: string, repo: string): Promise<number | null> {
   if (!githubApp) {
-    console.log('GitHub App not configured - running in development mode without GitHub App features');
+    logger.info('GitHub App not configured - running in development mode without GitHub App features');
     return null;
   }
 
@@ -86,7 +104,7 @@ export async function getInstallationIdForRepo(owner: string, repo: string): Pro
     );
     return data.id;
   } catch (error) {
-    console.error(`No installation found for ${owner}/${repo}:`, error);
+    logger.error(`No installation found for ${owner}/${repo}`, error);
     return null;
   }
 }
@@ -99,7 +117,7 @@ export async function getInstallationIdForAccount(accountId: number): Promise<nu
     });
     return installation?.installationId || null;
   } catch {
-    console.error('Failed to get installation for account');
+    logger.error('Failed to get installation for account');
     return null;
   }
 }
@@ -135,7 +153,7 @@ export async function getUserFromInstallation(installationId: number) {
       accountType: installation?.accountType as 'User' | 'Organization' || 'User'
     };
   } catch (error) {
-    console.error('Failed to get user from installation:', error);
+    logger.error('Failed to get user from installation', error);
     return null;
   }
 }
@@ -176,27 +194,27 @@ export async function getBestOctokitForRepo(
       });
 
       if (userAccount?.installationId) {
-        console.log(`✅ User has linked installation ${userAccount.installationId}`);
+        logger.info('User has linked installation', { installationId: userAccount.installationId });
         
         // Check if this installation can access the repo
         try {
           const installationOctokit = await getInstallationOctokit(userAccount.installationId);
           await installationOctokit.request('GET /repos/{owner}/{repo}', { owner, repo });
-          console.log(`✅ Installation ${userAccount.installationId} can access ${owner}/${repo}`);
+          logger.info(`Installation ${userAccount.installationId} can access ${owner}/${repo}`);
           return installationOctokit;
         } catch {
-          console.log(`⚠️ Installation ${userAccount.installationId} cannot access ${owner}/${repo}, trying OAuth fallback`);
+          logger.info(`Installation ${userAccount.installationId} cannot access ${owner}/${repo}, trying OAuth fallback`);
         }
       }
     } catch (error) {
-      console.error('Error checking user installation:', error);
+      logger.error('Error checking user installation', error);
     }
   }
 
   // 2. Try to get installation-specific access for this repo
   const installationId = await getInstallationIdForRepo(owner, repo);
   if (installationId) {
-    console.log(`✅ Found installation ${installationId} for ${owner}/${repo}`);
+    logger.info(`Found installation ${installationId} for ${owner}/${repo}`);
     return await getInstallationOctokit(installationId);
   }
 
@@ -212,16 +230,16 @@ export async function getBestOctokitForRepo(
       });
       
       if (accessToken) {
-        console.log(`✅ Using OAuth token for ${owner}/${repo}`);
+        logger.info(`Using OAuth token for ${owner}/${repo}`);
         return new (await import('@octokit/rest')).Octokit({ auth: accessToken });
       }
     } catch (error) {
-      console.warn('Failed to get OAuth token, falling back to public API:', error);
+      logger.warn('Failed to get OAuth token, falling back to public API', { error: error instanceof Error ? error.message : String(error) });
     }
   }
 
   // 4. Fallback to app-level access (for public repos)
-  console.log(`⚠️ Using app-level access for ${owner}/${repo}`);
+  logger.info(`Using app-level access for ${owner}/${repo}`);
   if (!githubApp) {
     throw new Error('GitHub App not configured - cannot access repositories');
   }
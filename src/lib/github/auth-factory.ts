@@ -6,13 +6,25 @@ import { and, eq } from 'drizzle-orm';
 import { getInstallationToken } from './app';
 import type { BetterAuthSession } from './types';
 import { SessionData } from '@/lib/types/errors';
+import { createLogger } from '@/lib/logging';
+
+const logger = createLogger('GitHubAuth');
+
+// Shared public-API client. The public Octokit is stateless (its token comes
+// from env), yet it used to be rebuilt on every fallback path — repo pages,
+// scorecards and profile lookups all pay for plugin registration and a fresh
+// connection pool per request. Construct it once and reuse it.
+let publicOctokit: Octokit | null = null;
 
 // Factory functions for different authentication methods
 export class GitHubAuthFactory {
   // Create service with public API key (for unauthenticated users)
   static createPublic(): Octokit {
-    console.log('🔑 Using public GitHub API key');
-    return new Octokit({ auth: process.env.GITHUB_PUBLIC_API_KEY! });
+    if (!publicOctokit) {
+      logger.info('Creating shared public GitHub API client');
+      publicOctokit = new Octokit({ auth: process.env.GITHUB_PUBLIC_API_KEY! });
+    }
+    return publicOctokit;
   }
 
   // Create service with GitHub App installation (for authenticated users with installations)
@@ -30,12 +42,12 @@ export class GitHubAuthFactory {
       });
 
       if (userAccount?.installationId) {
-        console.log(`✅ Using GitHub App installation ${userAccount.installationId} for authenticated user`);
+        logger.info('Using GitHub App installation for authenticated user', { installationId: userAccount.installationId });
         const installationToken = await getInstallationToken(userAccount.installationId);
         return new Octokit({ auth: installationToken });
       }
     } catch (error) {
-      console.warn('Failed to create GitHub App service:', error);
+      logger.warn('Failed to create GitHub App service', { error: error instanceof Error ? error.message : String(error) });
     }
 
     return null;
@@ -57,11 +69,11 @@ export class GitHubAuthFactory {
       });
       
       if (accessToken) {
-        console.log('🔐 Using OAuth token for authenticated user');
+        logger.info('Using OAuth token for authenticated user');
         return new Octokit({ auth: accessToken });
       }
     } catch (error) {
-      console.warn('Failed to get OAuth token:', error);
+      logger.warn('Failed to get OAuth token', { error: error instanceof Error ? error.message : String(error) });
     }
 
     return null;
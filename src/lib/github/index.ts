@@ -10,6 +10,9 @@ import type {
 } from './types';
 import { DEFAULT_MAX_FILES } from './types';
 import { SessionData } from '@/lib/types/errors';
+import { createLogger } from '@/lib/logging';
+
+const logger = createLogger('GitHubService');
 
 // Main GitHub service - simple facade that coordinates other services
 export class GitHubService {
@@ -151,8 +154,7 @@ export async function createGitHubServiceForRepo(
 
   const tag = `[gh-auth ${owner}/${repo}]`;
   const logStep = (step: string, extra?: Record<string, unknown>) => {
-    if (extra) console.log(`${tag} ${step}`, extra);
-    else console.log(`${tag} ${step}`);
+    logger.info(`${tag} ${step}`, extra);
   };
 
   const getGitHubUsername = (): string | null => {
@@ -34,7 +34,7 @@ export async function getProfileData(username: string) {
 
   if (profileResult.length > 0) {
     const profile = profileResult[0];
-    const isStale = new Date().getTime() - profile.updatedAt.getTime() > 7 * 24 * 60 * 60 * 1000; // 7 days
+    const isStale = Date.now() - profile.updatedAt.getTime() > 7 * 24 * 60 * 60 * 1000; // 7 days
     return {
       profile: profile.profileData as DeveloperProfile,
       cached: true,
@@ -3,11 +3,12 @@ import { router, protectedProcedure, publicProcedure } from '@/lib/trpc/trpc';
 import { db } from '@/db';
 import { aiSlopAnalyses, tokenUsage } from '@/db/schema';
 import { eq, and, desc, sql } from 'drizzle-orm';
-import { generateAISlopAnalysis, aiSlopSchema } from '@/lib/ai/ai-slop';
+import { generateAISlopAnalysis } from '@/lib/ai/ai-slop';
 import { TRPCError } from '@trpc/server';
 import { createGitHubServiceForRepo } from '@/lib/github';
 import { getUserPlanAndKey, getApiKeyForUser } from '@/lib/utils/user-plan';
 import { createJob, consumeJob } from '@/lib/analysis/job-store';
+import { analysisJobInputSchema, repoVersionInputSchema } from '@/lib/trpc/schemas';
 import { isPgErrorWithCode } from '@/lib/db/utils';
 
 /**
@@ -27,9 +28,11 @@ async function* streamProgressWithHeartbeat(
   promise.then(() => { done = true; }).catch(() => { done = true; });
 
   while (!done) {
-    // Yield any queued progress events
-    while (progressQueue.length > 0) {
-      const event = progressQueue.shift()!;
+    // Yield the latest queued progress event. Bursts coalesce to one frame —
+    // progress is monotonic and the client only renders the most recent state.
+    if (progressQueue.length > 0) {
+      const event = progressQueue[progressQueue.length - 1];
+      progressQueue.length = 0;
       yield { type: 'progress', message: event.message, progress: event.progress };
     }
     // Yield heartbeat to keep connection alive
@@ -38,9 +41,10 @@ async function* streamProgressWithHeartbeat(
     await new Promise(r => setTimeout(r, heartbeatInterval));
   }
 
-  // Yield any remaining progress events after completion
-  while (progressQueue.length > 0) {
-    const event = progressQueue.shift()!;
+  // Yield the final progress state after completion
+  if (progressQueue.length > 0) {
+    const event = progressQueue[progressQueue.length - 1];
+    progressQueue.length = 0;
     yield { type: 'progress', message: event.message, progress: event.progress };
   }
 }
@@ -54,12 +58,7 @@ async function* streamProgressWithHeartbeat(
 export const aiSlopRouter = router({
   // Step 1: POST mutation to store file selection
   createAnalysisJob: protectedProcedure
-    .input(z.object({
-      user: z.string(),
-      repo: z.string(),
-      ref: z.string().optional(),
-      filePaths: z.array(z.string()).default([]),
-    }))
+    .input(analysisJobInputSchema)
     .mutation(async ({ input, ctx }) => {
       const jobId = await createJob({
         user: input.user,
@@ -157,7 +156,9 @@ export const aiSlopRouter = router({
 
         // Get the analysis result
         const result = await analysisPromise;
-        const analysisData = aiSlopSchema.parse(result.analysis);
+        // generateObject already validated the result against aiSlopSchema —
+        // re-parsing here was a second full schema walk over the same object.
+        const analysisData = result.analysis;
 
         yield { type: 'progress', progress: 85, message: 'Saving results...' };
 
@@ -259,12 +260,7 @@ export const aiSlopRouter = router({
   // Same resilience as publicGetScorecard: cached analyses are the source of truth,
   // never block returning them on a live GitHub API call (which can flake).
   publicGetAISlop: publicProcedure
-    .input(z.object({
-      user: z.string(),
-      repo: z.string(),
-      ref: z.string().optional(),
-      version: z.number().optional(),
-    }))
+    .input(repoVersionInputSchema)
     .query(async ({ input, ctx }) => {
       const { user, repo, version } = input;
       const normalizedUser = user.toLowerCase();
@@ -324,7 +320,7 @@ export const aiSlopRouter = router({
 
       if (cached.length > 0) {
         const analysis = cached[0];
-        const isStale = new Date().getTime() - analysis.updatedAt.getTime() > 24 * 60 * 60 * 1000;
+        const isStale = Date.now() - analysis.updatedAt.getTime() > 24 * 60 * 60 * 1000;
         return {
           analysis: {
             metrics: analysis.metrics,
@@ -35,7 +35,7 @@ export const diagramRouter = router({
 
       if (cached.length > 0) {
         const diagram = cached[0];
-        const isStale = new Date().getTime() - diagram.updatedAt.getTime() > 24 * 60 * 60 * 1000; // 24 hours
+        const isStale = Date.now() - diagram.updatedAt.getTime() > 24 * 60 * 60 * 1000; // 24 hours
         
         return {
           diagramCode: diagram.diagramCode,
@@ -121,7 +121,7 @@ export const diagramRouter = router({
       
       if (cached.length > 0) {
         const diagram = cached[0];
-        const isStale = new Date().getTime() - diagram.updatedAt.getTime() > 24 * 60 * 60 * 1000; // 24 hours
+        const isStale = Date.now() - diagram.updatedAt.getTime() > 24 * 60 * 60 * 1000; // 24 hours
         return {
           diagramCode: diagram.diagramCode,
           format: diagram.format,
@@ -26,7 +26,7 @@ export const profileGenerateRouter = router({
         .limit(1);
 
       const hasRecentProfile = recentProfile.length > 0 &&
-        (new Date().getTime() - recentProfile[0].updatedAt.getTime() < 5 * 60 * 1000);
+        (Date.now() - recentProfile[0].updatedAt.getTime() < 5 * 60 * 1000);
 
       const { isGenerationInProgress } = await import('@/lib/rate-limit');
       const lockExists = await isGenerationInProgress(lockKey);
@@ -63,7 +63,7 @@ export const profileGenerateRouter = router({
 
         if (recentProfile.length > 0) {
           const profile = recentProfile[0];
-          const timeSinceUpdate = new Date().getTime() - profile.updatedAt.getTime();
+          const timeSinceUpdate = Date.now() - profile.updatedAt.getTime();
           if (timeSinceUpdate < 5 * 60 * 1000) {
             yield { type: 'progress', progress: 100, message: 'Profile was just generated! Loading results...' };
             yield {
@@ -337,7 +337,7 @@ export const profileGenerateRouter = router({
 
             const ONE_HOUR = 60 * 60 * 1000;
             const timeSinceLastEmail = emailRecord?.lastUsedAt
-              ? new Date().getTime() - emailRecord.lastUsedAt.getTime()
+              ? Date.now() - emailRecord.lastUsedAt.getTime()
               : Infinity;
 
             if (timeSinceLastEmail >= ONE_HOUR) {
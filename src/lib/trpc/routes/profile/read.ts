@@ -26,7 +26,7 @@ export const profileReadRouter = router({
 
       if (cached.length > 0) {
         const profile = cached[0];
-        const isStale = new Date().getTime() - profile.updatedAt.getTime() > 7 * 24 * 60 * 60 * 1000;
+        const isStale = Date.now() - profile.updatedAt.getTime() > 7 * 24 * 60 * 60 * 1000;
         return {
           profile: profile.profileData,
           cached: true,
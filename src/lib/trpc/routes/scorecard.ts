@@ -5,22 +5,22 @@ import { repositoryScorecards, tokenUsage } from '@/db/schema';
 import { eq, and, desc, sql } from 'drizzle-orm';
 import { generateScorecardAnalysis } from '@/lib/ai/scorecard';
 import { TRPCError } from '@trpc/server';
-import { scorecardSchema } from '@/lib/types/scorecard';
 import { createGitHubServiceForRepo } from '@/lib/github';
 import { executeAnalysisWithVersioning } from '@/lib/trpc/helpers/analysis-executor';
 import { getUserPlanAndKey, getApiKeyForUser } from '@/lib/utils/user-plan';
 import { createJob, consumeJob } from '@/lib/analysis/job-store';
+import { analysisJobInputSchema, repoVersionInputSchema } from '@/lib/trpc/schemas';
+import { ProgressQueue } from '@/lib/analysis/progress-queue';
+import { CACHE_CONFIG } from '@/lib/config';
 import { generateScorecardEmbedding } from '@/lib/ai/embeddings';
 
+// Cached analyzed-repo count for the public counter (see getAnalyzedRepoCount).
+let analyzedRepoCount: { value: number; timestamp: number } | null = null;
+
 export const scorecardRouter = router({
   // Step 1: POST mutation to store file selection, returns a short jobId
   createAnalysisJob: protectedProcedure
-    .input(z.object({
-      user: z.string(),
-      repo: z.string(),
-      ref: z.string().optional(),
-      filePaths: z.array(z.string()).default([]),
-    }))
+    .input(analysisJobInputSchema)
     .mutation(async ({ input, ctx }) => {
       const jobId = await createJob({
         user: input.user,
@@ -118,12 +118,13 @@ export const scorecardRouter = router({
           .limit(1);
 
         // Generate scorecard (auto-chunks large repos with map-reduce).
-        // Run in the background and poll the progress queue so we can yield
-        // events as they happen. Without this, the client sees a 30s+ silent
-        // gap during AI calls, hits its inactivity-reconnect threshold, and
-        // restarts the generator from the top in a loop.
-        const progressQueue: Array<{ message: string; progress: number }> = [];
-        let analysisDone = false;
+        // Run it in the background and bridge its onProgress callbacks into
+        // this generator through a push-based queue. Without the bridge, the
+        // client sees a 30s+ silent gap during AI calls, hits its
+        // inactivity-reconnect threshold, and restarts the generator from the
+        // top in a loop. The queue wakes the consumer on push, so events are
+        // forwarded immediately instead of on the next poll tick.
+        const progressQueue = new ProgressQueue<{ message: string; progress: number }>();
         let analysisError: unknown = null;
         let analysisResult: Awaited<ReturnType<typeof generateScorecardAnalysis>> | null = null;
 
@@ -143,18 +144,22 @@ export const scorecardRouter = router({
           },
         }).then(res => {
           analysisResult = res;
-          analysisDone = true;
         }).catch(err => {
           analysisError = err;
-          analysisDone = true;
+        }).finally(() => {
+          progressQueue.close();
         });
 
+        // Wake the consumer promptly when the client goes away instead of
+        // letting it sleep out the rest of a heartbeat interval.
+        signal?.addEventListener('abort', () => progressQueue.wake(), { once: true });
+
         let lastYieldAt = Date.now();
         let lastProgress = 10;
         let lastMessage = `Analyzing ${files.length} files...`;
         const HEARTBEAT_MS = 12_000; // < client reconnectAfterInactivityMs (30_000)
 
-        while (!analysisDone) {
+        while (!progressQueue.isClosed) {
           if (signal?.aborted) {
             // Caller went away; let the background promise settle on its own.
             console.log(`${tag} client aborted at ${elapsed()}`);
@@ -162,10 +167,15 @@ export const scorecardRouter = router({
           }
 
           let yielded = false;
-          while (progressQueue.length > 0) {
-            const p = progressQueue.shift()!;
-            lastProgress = p.progress;
-            lastMessage = p.message;
+          // Coalesce bursts: several chunks completing together queue several
+          // events, but progress is monotonic and the client only renders the
+          // most recent state — forwarding each one is pure frame/rerender
+          // churn. Yield only the latest from each drain.
+          const pending = progressQueue.drain();
+          if (pending.length > 0) {
+            const latest = pending[pending.length - 1];
+            lastProgress = latest.progress;
+            lastMessage = latest.message;
             yield { type: 'progress', progress: lastProgress, message: lastMessage };
             yielded = true;
           }
@@ -177,7 +187,7 @@ export const scorecardRouter = router({
             lastYieldAt = Date.now();
           }
 
-          await new Promise(r => setTimeout(r, 500));
+          await progressQueue.wait(HEARTBEAT_MS - (Date.now() - lastYieldAt));
         }
         await analysisPromise;
         // If the client aborted while the AI was running, the background promise
@@ -190,9 +200,11 @@ export const scorecardRouter = router({
         if (!analysisResult) throw new Error('Analysis returned no result');
         const result = analysisResult as Awaited<ReturnType<typeof generateScorecardAnalysis>>;
 
-        // Drain any final progress updates that landed during the await.
-        for (const p of progressQueue) {
-          yield { type: 'progress', progress: p.progress, message: p.message };
+        // Forward the final progress state that landed during the await.
+        const finalPending = progressQueue.drain();
+        if (finalPending.length > 0) {
+          const latest = finalPending[finalPending.length - 1];
+          yield { type: 'progress', progress: latest.progress, message: latest.message };
         }
         console.log(`${tag} generation done ${elapsed()}`);
 
@@ -203,7 +215,9 @@ export const scorecardRouter = router({
             usage: result.usage,
           };
         }
-        const parsedData = scorecardSchema.parse(result.scorecard);
+        // generateObject already validated the result against scorecardSchema —
+        // re-parsing here was a second full schema walk over the same object.
+        const parsedData = result.scorecard;
 
         // Check if content is identical to the most recent version
         if (existingScorecard[0]) {
@@ -344,12 +358,7 @@ export const scorecardRouter = router({
   // row is flagged private *and* the caller is signed-out, to confirm whether
   // the repo has gone public since (self-healing flip).
   publicGetScorecard: publicProcedure
-    .input(z.object({
-      user: z.string(),
-      repo: z.string(),
-      ref: z.string().optional(),
-      version: z.number().optional(),
-    }))
+    .input(repoVersionInputSchema)
     .query(async ({ input, ctx }) => {
       const { user, repo, version } = input;
       const normalizedUser = user.toLowerCase();
@@ -413,7 +422,7 @@ export const scorecardRouter = router({
             .catch((err) => console.warn('[publicGetScorecard] flag flip failed:', err));
         }
 
-        const isStale = new Date().getTime() - scorecard.updatedAt.getTime() > 24 * 60 * 60 * 1000;
+        const isStale = Date.now() - scorecard.updatedAt.getTime() > 24 * 60 * 60 * 1000;
         return {
           scorecard: {
             metrics: scorecard.metrics,
@@ -450,11 +459,19 @@ export const scorecardRouter = router({
   // Get total count of unique analyzed repos (public only)
   getAnalyzedRepoCount: publicProcedure
     .query(async () => {
+      // COUNT(DISTINCT …) scans the whole scorecards table and the result
+      // only moves when an analysis completes — serve a cached value instead
+      // of rescanning for every landing-page visit.
+      if (analyzedRepoCount && Date.now() - analyzedRepoCount.timestamp < CACHE_CONFIG.SHORT_CACHE_TTL_MS) {
+        return analyzedRepoCount.value;
+      }
       const result = await db
         .select({ count: sql<number>`COUNT(DISTINCT ${repositoryScorecards.repoOwner} || '/' || ${repositoryScorecards.repoName})` })
         .from(repositoryScorecards)
         .where(eq(repositoryScorecards.isPrivate, false));
-      return result[0]?.count ?? 0;
+      const count = result[0]?.count ?? 0;
+      analyzedRepoCount = { value: count, timestamp: Date.now() };
+      return count;
     }),
 
   getAllAnalyzedRepos: publicProcedure
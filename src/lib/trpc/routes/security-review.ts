@@ -4,11 +4,11 @@ import { db } from '@/db';
 import { securityReviews, tokenUsage } from '@/db/schema';
 import { eq, and, desc, sql } from 'drizzle-orm';
 import { generateSecurityReview } from '@/lib/ai/security-review';
-import { securityReviewSchema } from '@/lib/types/security-review';
 import { TRPCError } from '@trpc/server';
 import { createGitHubServiceForRepo } from '@/lib/github';
 import { getUserPlanAndKey, getApiKeyForUser } from '@/lib/utils/user-plan';
 import { createJob, consumeJob } from '@/lib/analysis/job-store';
+import { analysisJobInputSchema, repoVersionInputSchema } from '@/lib/trpc/schemas';
 import { isPgErrorWithCode } from '@/lib/db/utils';
 import { checkRepositoryWriteAccess } from '@/lib/wiki/permissions';
 
@@ -25,28 +25,27 @@ async function* streamProgressWithHeartbeat(
   promise.then(() => { done = true; }).catch(() => { done = true; });
 
   while (!done) {
-    while (progressQueue.length > 0) {
-      const event = progressQueue.shift()!;
+    // Coalesce queued bursts to the latest event — progress is monotonic and
+    // the client only renders the most recent state.
+    if (progressQueue.length > 0) {
+      const event = progressQueue[progressQueue.length - 1];
+      progressQueue.length = 0;
       yield { type: 'progress', message: event.message, progress: event.progress };
     }
     yield { type: 'ping' };
     await new Promise(r => setTimeout(r, heartbeatInterval));
   }
 
-  while (progressQueue.length > 0) {
-    const event = progressQueue.shift()!;
+  if (progressQueue.length > 0) {
+    const event = progressQueue[progressQueue.length - 1];
+    progressQueue.length = 0;
     yield { type: 'progress', message: event.message, progress: event.progress };
   }
 }
 
 export const securityReviewRouter = router({
   createAnalysisJob: protectedProcedure
-    .input(z.object({
-      user: z.string(),
-      repo: z.string(),
-      ref: z.string().optional(),
-      filePaths: z.array(z.string()).default([]),
-    }))
+    .input(analysisJobInputSchema)
     .mutation(async ({ input, ctx }) => {
       const jobId = await createJob({
         user: input.user,
@@ -149,7 +148,9 @@ export const securityReviewRouter = router({
         }
 
         const result = await analysisPromise;
-        const reviewData = securityReviewSchema.parse(result.review);
+        // generateObject already validated the result against securityReviewSchema —
+        // re-parsing here was a second full schema walk over the same object.
+        const reviewData = result.review;
 
         yield { type: 'progress', progress: 85, message: 'Saving security profile...' };
 
@@ -246,12 +247,7 @@ export const securityReviewRouter = router({
     }),
 
   publicGetSecurityReview: publicProcedure
-    .input(z.object({
-      user: z.string(),
-      repo: z.string(),
-      ref: z.string().optional(),
-      version: z.number().optional(),
-    }))
+    .input(repoVersionInputSchema)
     .query(async ({ input, ctx }) => {
       const { user, repo, version } = input;
       const normalizedUser = user.toLowerCase();
@@ -318,7 +314,7 @@ export const securityReviewRouter = router({
 
       if (cached.length > 0) {
         const review = cached[0];
-        const isStale = new Date().getTime() - review.updatedAt.getTime() > 24 * 60 * 60 * 1000;
+        const isStale = Date.now() - review.updatedAt.getTime() > 24 * 60 * 60 * 1000;
         return {
           review: {
             metrics: review.metrics,
@@ -59,7 +59,7 @@ export const userRouter = router({
       apiKey: z.string().min(1, 'API key is required') 
     }))
     .mutation(async ({ input, ctx }) => {
-      const encrypted = encryptApiKey(input.apiKey);
+      const encrypted = await encryptApiKey(input.apiKey);
       
       await db.insert(userApiKeys).values({
         userId: ctx.user.id,
@@ -0,0 +1,26 @@
+import { z } from 'zod';
+
+/**
+ * Shared input schemas for repo-scoped tRPC procedures.
+ *
+ * The analysis routers (scorecard, ai-slop, security-review) each re-declared
+ * identical user/repo/ref input shapes inline. Declaring each shape once means
+ * zod compiles the validator a single time and the routers can't drift on
+ * optionality or defaults.
+ */
+
+/** POST-step input for the two-step job + SSE analysis flow. */
+export const analysisJobInputSchema = z.object({
+  user: z.string(),
+  repo: z.string(),
+  ref: z.string().optional(),
+  filePaths: z.array(z.string()).default([]),
+});
+
+/** Read input for fetching the latest or a specific version of an analysis. */
+export const repoVersionInputSchema = z.object({
+  user: z.string(),
+  repo: z.string(),
+  ref: z.string().optional(),
+  version: z.number().optional(),
+});
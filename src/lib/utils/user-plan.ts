@@ -20,7 +20,7 @@ export async function getUserApiKey(userId: string) {
   }
   
   try {
-    return decryptApiKey(keyRecord.encryptedGeminiApiKey);
+    return await decryptApiKey(keyRecord.encryptedGeminiApiKey);
   } catch (error) {
     console.error('Failed to decrypt API key:', error);
     return null;
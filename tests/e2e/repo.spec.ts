@@ -1,14 +1,35 @@
-import { test, expect } from '@playwright/test';
+import { test, expect, type BrowserContext, type Page } from '@playwright/test';
 
 test.describe('Repository Page', () => {
-  test('should load a repository page', async ({ page }) => {
+  // The repo page kicks off data fetches against GitHub on load, so each
+  // test re-navigating paid that cost three times over. Share one page and
+  // one navigation across the assertions instead. Serial mode pins the
+  // tests to one worker — under fullyParallel they'd spread across
+  // workers, each re-running beforeAll and its own navigation.
+  test.describe.configure({ mode: 'serial' });
+
+  let context: BrowserContext;
+  let page: Page;
+
+  test.beforeAll(async ({ browser }) => {
+    // Build the context from the project's use options so the mobile
+    // project keeps its Pixel 5 emulation — browser.newPage() would give
+    // every project a default desktop context.
+    context = await browser.newContext(test.info().project.use);
+    page = await context.newPage();
     await page.goto('/torvalds/linux');
+  });
+
+  test.afterAll(async () => {
+    await context.close();
+  });
+
+  test('should load a repository page', async () => {
     await expect(page).toHaveURL(/torvalds\/linux/);
     await expect(page.locator('body')).toBeVisible();
   });
 
-  test('should display repo header', async ({ page }) => {
-    await page.goto('/torvalds/linux');
+  test('should display repo header', async () => {
     // The repo header may take time to render depending on data fetch
     const header = page.getByTestId('repo-header-title');
     const hasHeader = await header.isVisible({ timeout: 15000 }).catch(() => false);
@@ -18,8 +39,7 @@ test.describe('Repository Page', () => {
     }
   });
 
-  test('should not crash on repo page', async ({ page }) => {
-    await page.goto('/torvalds/linux');
+  test('should not crash on repo page', async () => {
     // Verify no JS errors by checking page is interactive
     await page.waitForLoadState('domcontentloaded');
     const body = page.locator('body');
@@ -127,7 +127,7 @@ describe('Payment Integration Tests', () => {
     test('can save and retrieve encrypted API key', async () => {
       
       const testApiKey = 'gza_test_key_123456789';
-      const encrypted = encryptApiKey(testApiKey);
+      const encrypted = await encryptApiKey(testApiKey);
 
       // Save encrypted key
       await db.insert(userApiKeys).values({
@@ -144,15 +144,15 @@ describe('Payment Integration Tests', () => {
       expect(apiKeyRecord?.encryptedGeminiApiKey).toBe(encrypted);
 
       // Verify decryption works
-      const decrypted = decryptApiKey(encrypted);
+      const decrypted = await decryptApiKey(encrypted);
       expect(decrypted).toBe(testApiKey);
     });
 
     test('can update existing API key', async () => {
       const { encryptApiKey } = await import('@/lib/utils/encryption');
       
-      const firstKey = encryptApiKey('gza_first_key_123');
-      const secondKey = encryptApiKey('gza_second_key_456');
+      const firstKey = await encryptApiKey('gza_first_key_123');
+      const secondKey = await encryptApiKey('gza_second_key_456');
 
       // Insert first key
       await db.insert(userApiKeys).values({
@@ -57,8 +57,8 @@ test('Payment Integration Smoke Test', async () => {
     const { encryptApiKey, decryptApiKey } = await import('@/lib/utils/encryption');
     
     const testKey = 'gza_test_key_123456789';
-    const encrypted = encryptApiKey(testKey);
-    const decrypted = decryptApiKey(encrypted);
+    const encrypted = await encryptApiKey(testKey);
+    const decrypted = await decryptApiKey(encrypted);
     
     expect(decrypted).toBe(testKey);
     expect(encrypted).not.toBe(testKey); // Should be encrypted